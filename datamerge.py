@@ -7,18 +7,137 @@ Beginner-friendly features:
 - De-duplication on key columns
 - Merge with an audit trail (how many matched, left-only, right-only)
 - Simple conflict resolution for overlapping columns (prefer left/right, or coalesce)
+- Optional Polars backend that runs the whole read→dedupe→merge as one lazy plan
 
-Requires: pandas
+Requires: pandas, pyarrow (polars for backend="polars")
 """
 
 from __future__ import annotations
-from typing import Dict, Iterable, List, Optional, Tuple, Literal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Literal
+import csv
+import functools
+import io
+import logging
+import numpy as np
 import pandas as pd
-import sys
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+# Warnings and de-dupe notes go through logging; configure the "datamerge" logger to see them
+logger = logging.getLogger("datamerge")
 
 # Type hint for join type
 JoinHow = Literal["inner", "left", "right", "outer"]
 
+# Which engine quick_merge_with_audit runs on ("polars" needs the optional polars package)
+Backend = Literal["pandas", "polars"]
+
+# How read_csv hands string columns to pandas: Arrow-backed "string[pyarrow]" or Python objects
+StringBackend = Literal["pyarrow", "python"]
+
+# Category order pandas uses for the _merge indicator column
+MERGE_CATEGORIES = ["left_only", "right_only", "both"]
+
+# pandas dtype names we know how to hand straight to the Arrow CSV parser
+_ARROW_TYPES: Dict[str, pa.DataType] = {
+    "int8": pa.int8(), "Int8": pa.int8(),
+    "int16": pa.int16(), "Int16": pa.int16(),
+    "int32": pa.int32(), "Int32": pa.int32(),
+    "int64": pa.int64(), "Int64": pa.int64(),
+    "float32": pa.float32(), "Float32": pa.float32(),
+    "float64": pa.float64(), "Float64": pa.float64(),
+    "bool": pa.bool_(), "boolean": pa.bool_(),
+    "str": pa.string(), "string": pa.string(), "object": pa.string(),
+    "category": pa.dictionary(pa.int32(), pa.string()),
+    "datetime64[ns]": pa.timestamp("ns"),
+}
+
+
+def _to_arrow(dtype) -> Optional[pa.DataType]:
+    """
+    Translate a pandas dtype (e.g. "Int64") to an Arrow type, or None if we don't know it.
+    """
+    if isinstance(dtype, pa.DataType):
+        return dtype
+    if isinstance(dtype, pd.ArrowDtype):
+        return dtype.pyarrow_dtype
+    return _ARROW_TYPES.get(str(dtype))
+
+
+def _is_arrow_backed(dtype) -> bool:
+    """
+    True for pandas dtypes whose data lives in Arrow arrays (ArrowDtype, "string[pyarrow]", "str").
+    """
+    if isinstance(dtype, pd.ArrowDtype):
+        return True
+    return isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"
+
+
+def _wrap_arrow(values, dtype) -> pd.api.extensions.ExtensionArray:
+    """
+    Wrap an Arrow (Chunked)Array back into a pandas array of the given Arrow-backed dtype.
+    """
+    if isinstance(dtype, pd.ArrowDtype):
+        return pd.arrays.ArrowExtensionArray(values)
+    return pd.array(values, dtype=dtype)
+
+
+def _pandas_types_mapper(string_backend: StringBackend = "pyarrow"):
+    """
+    types_mapper for Table.to_pandas: strings as "string[pyarrow]" (or default conversion for
+    string_backend="python"), everything else as zero-copy ArrowDtype.
+    """
+    def mapper(arrow_type: pa.DataType):
+        if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+            return pd.StringDtype("pyarrow") if string_backend == "pyarrow" else None
+        return pd.ArrowDtype(arrow_type)
+    return mapper
+
+
+@functools.lru_cache(maxsize=None)
+def _column_cleaner(lower: bool, strip: bool, spaces_to_underscores: bool) -> Callable[[pa.Array], pa.Array]:
+    """
+    Build the header-cleaning pipeline once per flag combination, holding only the enabled
+    Arrow string kernels, so repeated calls don't re-check the flags.
+    """
+    steps = []
+    if strip:
+        steps.append(pc.utf8_trim_whitespace)
+    if lower:
+        steps.append(pc.utf8_lower)
+    if spaces_to_underscores:
+        steps.append(functools.partial(pc.replace_substring, pattern=" ", replacement="_"))
+
+    def clean(arr: pa.Array) -> pa.Array:
+        for step in steps:
+            arr = step(arr)
+        return arr
+    return clean
+
+
+@functools.lru_cache(maxsize=128)
+def _clean_header(columns: Tuple[str, ...],
+                  lower: bool,
+                  strip: bool,
+                  spaces_to_underscores: bool) -> Tuple[str, ...]:
+    # Cached: the same (often wide) header tends to come back for every file of a batch
+    arr = pa.array(columns, type=pa.string())
+    return tuple(_column_cleaner(lower, strip, spaces_to_underscores)(arr).to_pylist())
+
+
+def _clean_column_names(columns: Iterable[str],
+                        lower: bool = True,
+                        strip: bool = True,
+                        spaces_to_underscores: bool = True) -> List[str]:
+    """
+    Apply the normalize_columns rules to a list of names, as vectorized Arrow string kernels
+    over the whole header rather than one Python call per column.
+    """
+    return list(_clean_header(tuple(columns), lower, strip, spaces_to_underscores))
+
+
 def normalize_columns(df: pd.DataFrame,
                       lower: bool = True,
                       strip: bool = True,
@@ -26,54 +145,362 @@ def normalize_columns(df: pd.DataFrame,
     """
     Standardize column names so joins don't fail because of casing or stray spaces.
     """
-    def _clean(col: str) -> str:
-        new = col
-        if strip:
-            new = new.strip()
-        if lower:
-            new = new.lower()
-        if spaces_to_underscores:
-            new = new.replace(" ", "_")
-        return new
-    df = df.rename(columns={c: _clean(c) for c in df.columns})
+    new_names = _clean_column_names(df.columns, lower=lower, strip=strip,
+                                    spaces_to_underscores=spaces_to_underscores)
+    df = df.rename(columns=dict(zip(df.columns, new_names)))
     return df
 
 
+def _read_header(path: str) -> List[str]:
+    """
+    Return the raw header row of a CSV without parsing the rest of the file.
+    A UTF-8 byte order mark (Excel exports) is dropped, and repeated names get ".1", ".2", ...
+    appended like pandas.read_csv does, so every column can be addressed by name.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        names = next(csv.reader(f), [])
+    taken = set(names)
+    counts: Dict[str, int] = {}
+    for i, name in enumerate(names):
+        count = counts.get(name, 0)
+        if count > 0:
+            base = name
+            while count > 0:  # same loop as pandas: skip "a.1" if the header already has one
+                counts[base] = count + 1
+                name = f"{base}.{count}"
+                count = count + 1 if name in taken else counts.get(name, 0)
+            names[i] = name
+        counts[name] = count + 1
+    return names
+
+
+def _parse_options(raw_names: List[str]) -> pacsv.ParseOptions:
+    """
+    Arrow's fast CSV parser treats every newline as the end of a row. Turn on quoted
+    newlines only when the header needs them, so skipping the header skips all of it.
+    """
+    return pacsv.ParseOptions(newlines_in_values=any("\n" in n or "\r" in n for n in raw_names))
+
+
+def _final_column_names(path: str,
+                        raw_names: List[str],
+                        rename_map: Optional[Dict[str, str]] = None) -> List[str]:
+    """
+    Renamed + normalized names for a raw header. Raises if two columns end up with the
+    same name (e.g. "City" and "city "), since neither could be selected by name afterwards.
+    """
+    rename_map = rename_map or {}
+    final_names = _clean_column_names(rename_map.get(c, c) for c in raw_names)
+    if len(set(final_names)) != len(final_names):
+        dupes = sorted({c for c in final_names if final_names.count(c) > 1})
+        raise ValueError(f"Duplicate column names after renaming/normalizing {path}: {dupes}")
+    return final_names
+
+
+def _plan_columns(path: str,
+                  dtype_map: Optional[Dict[str, str]],
+                  parse_dates: Optional[Iterable[str]],
+                  rename_map: Optional[Dict[str, str]],
+                  include_columns: Optional[Iterable[str]] = None):
+    """
+    Work out the final (renamed + normalized) name of every raw header column up front,
+    so dtypes, dates and column selection can be handed to the Arrow parser in a single pass.
+    Returns (final names of the columns to read, {final: raw}, Arrow column_types keyed by
+    raw name, {col: dtype} Arrow can't express, date columns, raw include_columns or None,
+    all raw header names for ReadOptions.column_names).
+    """
+    raw_names = _read_header(path)
+    final_names = _final_column_names(path, raw_names, rename_map)
+    raw_by_final = dict(zip(final_names, raw_names))
+
+    include_raw = None
+    if include_columns is not None:
+        wanted = set(include_columns)
+        missing = [c for c in include_columns if c not in raw_by_final]
+        if missing:
+            raise KeyError(f"Columns not found in {path}: {missing}")
+        # Keep file order so the frame looks the same as a full read, minus the skipped columns
+        final_names = [c for c in final_names if c in wanted]
+        raw_by_final = {c: raw_by_final[c] for c in final_names}
+        include_raw = [raw_by_final[c] for c in final_names]
+
+    column_types: Dict[str, pa.DataType] = {}
+    pandas_casts: Dict[str, str] = {}  # dtypes Arrow can't express; cast after loading
+    for col, dtype in (dtype_map or {}).items():
+        if col not in raw_by_final:
+            continue
+        arrow_type = _to_arrow(dtype)
+        if arrow_type is None:
+            pandas_casts[col] = dtype
+        else:
+            column_types[raw_by_final[col]] = arrow_type
+    date_cols = [c for c in (parse_dates or []) if c in raw_by_final]
+    for col in date_cols:
+        column_types[raw_by_final[col]] = pa.timestamp("ns")
+    return final_names, raw_by_final, column_types, pandas_casts, date_cols, include_raw, raw_names
+
+
+def _filter_values(col: str, values: Iterable, target: pa.DataType) -> pa.Array:
+    """
+    A filter's allowed values as an Arrow array of the column's type, so "1001" matches an
+    integer column and "2024-02-01" a date column. None in the values matches null cells.
+    """
+    if pa.types.is_dictionary(target):
+        target = target.value_type
+    try:
+        value_set = pa.array(list(values))
+        if value_set.type != target:
+            value_set = value_set.cast(target)
+    except pa.ArrowException as e:
+        raise ValueError(f"Filter values for column '{col}' don't fit its type {target}: {e}") from e
+    return value_set
+
+
+def _filter_table(table: pa.Table, filters: Dict[str, Iterable]) -> pa.Table:
+    """
+    Keep rows where every filter column's value is one of the allowed values.
+    """
+    mask = None
+    for col, values in filters.items():
+        if col not in table.column_names:
+            raise KeyError(f"Filter column not found: {col}")
+        column = table.column(col)
+        keep = pc.is_in(column, value_set=_filter_values(col, values, column.type))
+        mask = keep if mask is None else pc.and_(mask, keep)
+    return table if mask is None else table.filter(mask)
+
+
+def _cast_columns(df: pd.DataFrame, casts: Dict[str, str]) -> Dict[str, str]:
+    """
+    Cast columns in place with astype; a column that fails keeps its values.
+    Returns {column: error} for the failures so callers can report them all at once.
+    """
+    failures: Dict[str, str] = {}
+    for col, dtype in casts.items():
+        try:
+            df[col] = df[col].astype(dtype)
+        except Exception as e:
+            failures[col] = f"cast to {dtype}: {e}"
+    return failures
+
+
+def _parse_dates(values: pa.ChunkedArray) -> pa.ChunkedArray:
+    """
+    Parse a string column to timestamp[ns]. Values that aren't dates become null, like
+    pd.to_datetime(..., errors="coerce") in read_csv, instead of failing the whole column.
+    """
+    try:
+        return pc.cast(values, pa.timestamp("ns"))
+    except pa.ArrowInvalid:
+        parsed = pd.to_datetime(values.to_pandas(), errors="coerce")
+        return pa.chunked_array([pa.array(parsed, type=pa.timestamp("ns"), from_pandas=True)])
+
+
 def read_csv(path: str,
              dtype_map: Optional[Dict[str, str]] = None,
              parse_dates: Optional[Iterable[str]] = None,
-             rename_map: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+             rename_map: Optional[Dict[str, str]] = None,
+             string_backend: StringBackend = "pyarrow",
+             include_columns: Optional[List[str]] = None,
+             filters: Optional[Dict[str, Iterable]] = None) -> pd.DataFrame:
     """
     Load a CSV safely and optionally parse dtypes/dates and rename columns.
 
-    - dtype_map: e.g., {"customer_id": "Int64"} (note capital I for pandas nullable int)
-    - parse_dates: e.g., ["signup_date"]
+    - dtype_map: e.g., {"customer_id": "Int64"}; dtypes Arrow can express (ints, floats, dates,
+      bool, str, category) come back Arrow-backed, e.g. "Int64" -> int64[pyarrow];
+      the rest are cast with astype after loading
+    - parse_dates: e.g., ["signup_date"]; values that aren't dates become null
     - rename_map: e.g., {"Customer Id": "customer_id"} BEFORE normalization
+    - string_backend: "pyarrow" (default) keeps text as Arrow-backed "string[pyarrow]" columns,
+      which use far less memory than Python objects and hash faster in merges;
+      "python" gives plain object columns of str
+    - include_columns: only parse these (normalized) columns; the rest are skipped by the parser
+    - filters: e.g., {"city": ["Columbus", "Richmond"]} keeps only rows with those values,
+      applied before anything is converted to pandas
+    A column with values that don't fit its dtype is kept as-is (strings), with a warning.
     """
-    df = pd.read_csv(path)
-    if rename_map:
-        df = df.rename(columns=rename_map)
-    df = normalize_columns(df)  # standardize after optional rename
+    final_names, raw_by_final, column_types, pandas_casts, date_cols, include_raw, raw_names = _plan_columns(
+        path, dtype_map, parse_dates, rename_map, include_columns)
+    # Dates are read as text and parsed below, so one bad value only nulls that value
+    for col in date_cols:
+        column_types[raw_by_final[col]] = pa.string()
 
-    # Safe casting: try each dtype; if it fails, keep original and warn
-    if dtype_map:
-        for col, dtype in dtype_map.items():
-            if col in df.columns:
-                try:
-                    df[col] = df[col].astype(dtype)
-                except Exception as e:
-                    print(f"[WARN] Could not cast column '{col}' to {dtype}: {e}", file=sys.stderr)
+    # Name the columns ourselves (de-duplicated like pandas) instead of using the header row
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=64 << 20,
+                                     column_names=raw_names, skip_rows_after_names=1)
 
-    if parse_dates:
-        for col in parse_dates:
-            if col in df.columns:
-                try:
-                    df[col] = pd.to_datetime(df[col], errors="coerce")
-                except Exception as e:
-                    print(f"[WARN] Could not parse dates for '{col}': {e}", file=sys.stderr)
+    def _read(types: Dict[str, pa.DataType]) -> pa.Table:
+        return pacsv.read_csv(path,
+                              read_options=read_options,
+                              parse_options=_parse_options(raw_names),
+                              convert_options=pacsv.ConvertOptions(column_types=types,
+                                                                   timestamp_parsers=[pacsv.ISO8601],
+                                                                   strings_can_be_null=True,
+                                                                   include_columns=include_raw))
+
+    failures: Dict[str, str] = {}
+    try:
+        table = _read(column_types)
+    except pa.ArrowInvalid as e:
+        # Some value didn't fit its dtype_map type. Read the typed columns as text and cast
+        # them one by one, so only the columns that really fail are kept as strings.
+        logger.debug("Typed CSV read failed: %s", e)
+        table = _read({raw: pa.string() for raw in column_types})
+        for raw, arrow_type in column_types.items():
+            if pa.types.is_string(arrow_type):
+                continue
+            i = table.schema.get_field_index(raw)
+            try:
+                table = table.set_column(i, raw, pc.cast(table.column(i), arrow_type))
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as cast_error:
+                failures[raw] = f"cast to {arrow_type}: {cast_error}"
+        final_by_raw = dict(zip(raw_by_final.values(), raw_by_final))
+        failures = {final_by_raw[raw]: error for raw, error in failures.items()}
+
+    table = table.rename_columns(final_names)
+    for col in date_cols:
+        i = table.schema.get_field_index(col)
+        table = table.set_column(i, col, _parse_dates(table.column(i)))
+    if filters:
+        table = _filter_table(table, filters)
+    df = table.to_pandas(types_mapper=_pandas_types_mapper(string_backend),
+                         self_destruct=True, split_blocks=True)
+    del table
+
+    # Safe casting: try each dtype; if it fails, keep original and report all failures at once
+    failures.update(_cast_columns(df, pandas_casts))
+    if failures:
+        logger.warning("Could not convert columns in %s (kept as-is): %s", path, failures)
+
+    # Columns of text: Arrow strings, or Python objects if asked for
+    if string_backend == "pyarrow":
+        for col in df.select_dtypes(include="object").columns:
+            if pd.api.types.infer_dtype(df[col], skipna=True) == "string":
+                df[col] = df[col].astype("string[pyarrow]")
+    else:
+        for col in df.columns:
+            if isinstance(df[col].dtype, pd.StringDtype):
+                df[col] = df[col].astype(object)
     return df
 
 
+def _avg_row_bytes(path: str, sample_bytes: int = 1 << 20) -> float:
+    """
+    Estimate bytes per CSV row from the first chunk of the file.
+    """
+    with open(path, "rb") as f:
+        sample = f.read(sample_bytes)
+    return len(sample) / max(sample.count(b"\n"), 1)
+
+
+def _dedupe_table(table: pa.Table, keys: List[str], keep: str = "last") -> pa.Table:
+    """
+    Arrow version of drop_dupes_on: keep the first/last row per key, in original row order.
+    """
+    rows = pa.array(np.arange(table.num_rows))
+    agg = (table.select(keys).append_column("__row", rows)
+           .group_by(keys, use_threads=False)
+           .aggregate([("__row", "max" if keep == "last" else "min")]))
+    keep_rows = np.sort(agg.column(agg.num_columns - 1).to_numpy())
+    return table.take(keep_rows)
+
+
+def read_csv_batched(path: str,
+                     dtype_map: Optional[Dict[str, str]] = None,
+                     parse_dates: Optional[Iterable[str]] = None,
+                     rename_map: Optional[Dict[str, str]] = None,
+                     dedupe_keys: Optional[List[str]] = None,
+                     keep: str = "last",
+                     batch_rows: int = 1 << 17,
+                     include_columns: Optional[List[str]] = None,
+                     filters: Optional[Dict[str, Iterable]] = None) -> pa.Table:
+    """
+    Stream a CSV in blocks of roughly batch_rows rows and return an Arrow table, so peak
+    memory tracks the batch size (plus whatever survives de-duplication) instead of the file.
+
+    - dtype_map / parse_dates / rename_map: as in read_csv, applied to every batch
+    - dedupe_keys: drop duplicate keys batch by batch (and once more across batches)
+    - include_columns / filters: as in read_csv; filters run on each batch before de-duplication
+    Dtypes Arrow can't express are not applied here: cast them after to_pandas (as
+    quick_merge_with_audit does). Values in parse_dates columns that aren't dates become null.
+    Columns with values that don't fit their dtype (or, for untyped columns, the type of the
+    first block) are kept as strings, with a warning.
+    """
+    final_names, raw_by_final, column_types, unsupported, date_cols, include_raw, raw_names = _plan_columns(
+        path, dtype_map, parse_dates, rename_map, include_columns)
+    if unsupported:
+        logger.info("read_csv_batched: dtypes left for a cast after to_pandas: %s", unsupported)
+    # Dates are read as text and parsed per batch, so one bad value only nulls that value
+    for col in date_cols:
+        column_types[raw_by_final[col]] = pa.string()
+    if dedupe_keys:
+        missing = [k for k in dedupe_keys if k not in raw_by_final]
+        if missing:
+            raise KeyError(f"Keys not found in dataframe: {missing}")
+
+    read_options = pacsv.ReadOptions(use_threads=True,
+                                     block_size=max(int(batch_rows * _avg_row_bytes(path)), 1 << 16),
+                                     column_names=raw_names, skip_rows_after_names=1)
+
+    def _open(types: Dict[str, pa.DataType]) -> pacsv.CSVStreamingReader:
+        return pacsv.open_csv(path,
+                              read_options=read_options,
+                              parse_options=_parse_options(raw_names),
+                              convert_options=pacsv.ConvertOptions(column_types=types,
+                                                                   timestamp_parsers=[pacsv.ISO8601],
+                                                                   strings_can_be_null=True,
+                                                                   include_columns=include_raw))
+
+    def _read(types: Dict[str, pa.DataType]) -> Tuple[List[pa.Table], int]:
+        parts, rows_read = [], 0
+        for batch in _open(types):
+            part = pa.Table.from_batches([batch]).rename_columns(final_names)
+            for col in date_cols:
+                i = part.schema.get_field_index(col)
+                part = part.set_column(i, col, _parse_dates(part.column(i)))
+            if filters:
+                part = _filter_table(part, filters)
+            rows_read += part.num_rows
+            if dedupe_keys:
+                part = _dedupe_table(part, dedupe_keys, keep=keep)
+            parts.append(part)
+        return parts, rows_read
+
+    try:
+        parts, rows_read = _read(column_types)
+    except pa.ArrowInvalid as e:
+        # Either a value doesn't fit its dtype_map/parse_dates type, or an inferred column
+        # changed type further down (open_csv infers from the first block only, e.g. numbers
+        # that turn into text). Scan the file once as text to find every such column, then
+        # read it again with just those columns kept as strings.
+        logger.debug("Typed CSV read failed: %s", e)
+        inferred = _open({}).schema
+        wanted = {f.name: column_types.get(f.name, f.type) for f in inferred}
+        bad = set()
+        for batch in _open({raw: pa.string() for raw in wanted}):
+            for raw, arrow_type in wanted.items():
+                if raw in bad or pa.types.is_string(arrow_type):
+                    continue
+                try:
+                    pc.cast(batch.column(raw), arrow_type)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    bad.add(raw)
+        final_by_raw = {raw: final for final, raw in raw_by_final.items()}
+        logger.warning("Some values in %s don't fit their column's type, keeping these columns as strings: %s",
+                       path, [final_by_raw[raw] for raw in wanted if raw in bad])
+        parts, rows_read = _read({**wanted, **{raw: pa.string() for raw in bad}})
+
+    if not parts:
+        return pa.table({c: pa.array([], pa.string()) for c in final_names})
+    table = pa.concat_tables(parts)
+    if dedupe_keys:
+        table = _dedupe_table(table, dedupe_keys, keep=keep)
+        if table.num_rows != rows_read:
+            logger.info("read_csv_batched: removed %d duplicate rows based on %s.",
+                        rows_read - table.num_rows, dedupe_keys)
+    return table
+
+
 def drop_dupes_on(df: pd.DataFrame, keys: List[str], keep: str = "last") -> pd.DataFrame:
     """
     Drop duplicate key rows, keeping 'first' or 'last' occurrence.
@@ -82,41 +509,385 @@ def drop_dupes_on(df: pd.DataFrame, keys: List[str], keep: str = "last") -> pd.D
     if missing:
         raise KeyError(f"Keys not found in dataframe: {missing}")
     before = len(df)
-    out = df.drop_duplicates(subset=keys, keep=keep).copy()
+    # Hash only the key columns, then gather the surviving rows once (take already copies)
+    dupes = df.duplicated(subset=keys, keep=keep).to_numpy()
+    out = df.take(np.flatnonzero(~dupes))
     after = len(out)
     if after != before:
-        print(f"[INFO] drop_dupes_on: removed {before - after} duplicate rows based on {keys}.", file=sys.stderr)
+        logger.info("drop_dupes_on: removed %d duplicate rows based on %s.", before - after, keys)
     return out
 
 
+def _arrow_chunks(s: pd.Series) -> pa.ChunkedArray:
+    """
+    View a pandas column as an Arrow ChunkedArray (zero-copy for Arrow-backed columns).
+    """
+    arr = s.array
+    if hasattr(arr, "__arrow_array__"):
+        return pa.chunked_array(arr.__arrow_array__())
+    return pa.chunked_array([pa.array(arr, from_pandas=True)])
+
+
+def _is_plain_string(s: pd.Series) -> bool:
+    # Object columns are left to pandas: encoding them costs more than it saves
+    return isinstance(s.dtype, pd.StringDtype) or (
+        isinstance(s.dtype, pd.ArrowDtype)
+        and (pa.types.is_string(s.dtype.pyarrow_dtype) or pa.types.is_large_string(s.dtype.pyarrow_dtype)))
+
+
+def _is_arrow_dictionary(s: pd.Series) -> bool:
+    """
+    True for Arrow dictionary-encoded columns, like the ones read_csv gives for "category".
+    """
+    return isinstance(s.dtype, pd.ArrowDtype) and pa.types.is_dictionary(s.dtype.pyarrow_dtype)
+
+
+def _unify_dictionary_keys(left: pd.Series, right: pd.Series):
+    """
+    Put two dictionary-encoded key columns on one shared dictionary and return
+    (dictionary, int32 codes for left rows then right rows), or None if there is nothing to do.
+    unify_dictionaries only merges the dictionaries, so the cost follows the number of
+    distinct values, not the number of rows. Null keys get a code of their own at the end,
+    so they still match each other like they do in pandas.
+    """
+    l_arr, r_arr = _arrow_chunks(left), _arrow_chunks(right)
+    combined = pa.chunked_array(l_arr.chunks + r_arr.chunks, type=l_arr.type)
+    if len(combined) == 0:
+        return None
+    if combined.type.index_type.bit_width < 32:
+        # The union of both dictionaries can outgrow an int8/int16 index
+        combined = combined.cast(pa.dictionary(pa.int32(), combined.type.value_type))
+    combined = combined.unify_dictionaries()
+    values = combined.chunks[0].dictionary
+    null_code = len(values)
+    dictionary = pa.concat_arrays([values, pa.nulls(1, type=values.type)])
+    codes = np.concatenate([
+        c.indices.fill_null(null_code).to_numpy().astype(np.int32, copy=False)
+        for c in combined.chunks
+    ])
+    return dictionary, codes
+
+
+def _encode_string_keys(left: pd.DataFrame,
+                        right: pd.DataFrame,
+                        on: List[str],
+                        sort: bool = False):
+    """
+    Replace string join keys on both sides with int32 codes into one shared Arrow dictionary,
+    so pandas builds its hash table over small integers instead of strings.
+    Keys that are already dictionary-encoded (dtype "category") only have their
+    dictionaries unified, so the rows are not hashed again.
+    Returns the new frames plus {key: (dictionary, original dtype)} for _decode_keys.
+    With sort=True, codes follow the sorted dictionary so an outer join still comes out
+    ordered by key value.
+    """
+    codes_by_key = {}
+    dictionaries = {}
+    for k in on:
+        # Mixed key dtypes are left to pandas, which has its own rules for the result dtype
+        if left[k].dtype != right[k].dtype:
+            continue
+        if _is_arrow_dictionary(left[k]):
+            encoded = _unify_dictionary_keys(left[k], right[k])
+            if encoded is None:
+                continue
+            dictionary, codes = encoded
+        elif _is_plain_string(left[k]):
+            l_arr, r_arr = _arrow_chunks(left[k]), _arrow_chunks(right[k])
+            if l_arr.type != r_arr.type:
+                continue
+            combined = pa.chunked_array(l_arr.chunks + r_arr.chunks, type=l_arr.type)
+            if len(combined) == 0:  # nothing to encode, and dictionary_encode would give no chunks
+                continue
+            # null_encoding="encode" gives nulls their own code, so they still match each other
+            # like they do in pandas, and the codes never contain nulls.
+            combined = combined.dictionary_encode(null_encoding="encode")
+            dictionary = combined.chunks[-1].dictionary  # all chunks share one, growing, dictionary
+            codes = np.concatenate([c.indices.to_numpy() for c in combined.chunks])
+        else:
+            continue
+        if sort:
+            order = pc.array_sort_indices(dictionary, null_placement="at_end").to_numpy()
+            rank = np.empty_like(order, dtype=np.int32)
+            rank[order] = np.arange(len(order), dtype=np.int32)
+            codes = rank[codes]
+            dictionary = dictionary.take(pa.array(order))
+        codes_by_key[k] = codes
+        dictionaries[k] = (dictionary, left[k].dtype)
+
+    if not codes_by_key:
+        return left, right, dictionaries
+    n_left = len(left)
+    left = left.assign(**{k: c[:n_left] for k, c in codes_by_key.items()})
+    right = right.assign(**{k: c[n_left:] for k, c in codes_by_key.items()})
+    return left, right, dictionaries
+
+
+def _join_on_key_values(left: pd.DataFrame,
+                        right: pd.DataFrame,
+                        on: List[str],
+                        how: JoinHow,
+                        validate: Optional[str]) -> bool:
+    """
+    True when merge_frames should skip _encode_string_keys and join on the key values:
+    - inner joins on string keys: pandas already hashes Arrow strings as well as our codes
+      would, so encoding only adds work. Dictionary keys are still encoded (that only touches
+      the dictionaries), unless a single key repeats on both sides, where pandas orders int
+      keys differently than text keys.
+    - validate is going to fail: pandas' error then lists real keys instead of codes
+    """
+    if validate:
+        need_left, need_right = _VALIDATE_RULES.get(validate, (False, False))
+        if (need_left and left.duplicated(subset=on).any()) or (need_right and right.duplicated(subset=on).any()):
+            return True
+    if how != "inner":
+        return False
+    if not any(_is_arrow_dictionary(left[k]) for k in on):
+        return True
+    return len(on) == 1 and bool(left[on[0]].duplicated().any() and right[on[0]].duplicated().any())
+
+
+def _plain_keys(df: pd.DataFrame, on: List[str]) -> pd.DataFrame:
+    """
+    Swap Arrow dictionary keys for their plain values: pandas' own merge can't handle
+    dictionary keys that hold nulls.
+    """
+    plain = {k: df[k].astype(pd.ArrowDtype(df[k].dtype.pyarrow_dtype.value_type))
+             for k in on if _is_arrow_dictionary(df[k])}
+    return df.assign(**plain) if plain else df
+
+
+def _decode_keys(merged: pd.DataFrame, dictionaries) -> pd.DataFrame:
+    """
+    Turn int32 key codes from _encode_string_keys back into the original key values.
+    """
+    for k, (dictionary, dtype) in dictionaries.items():
+        codes = merged[k].to_numpy()
+        if isinstance(dtype, pd.ArrowDtype) and pa.types.is_dictionary(dtype.pyarrow_dtype):
+            # Keep the result dictionary-encoded: the codes already index the shared
+            # dictionary, so only the null entry has to be masked out.
+            is_null = pc.is_null(dictionary).to_numpy(zero_copy_only=False)[codes]
+            index_type = dtype.pyarrow_dtype.index_type
+            if len(dictionary) - 1 > np.iinfo(index_type.to_pandas_dtype()).max + 1:
+                index_type = pa.int32()  # the shared dictionary doesn't fit the original index type
+            indices = pa.array(codes, mask=is_null).cast(index_type)
+            values = pa.DictionaryArray.from_arrays(indices, dictionary)
+            merged[k] = pd.Series(pd.arrays.ArrowExtensionArray(values), index=merged.index)
+            continue
+        values = dictionary.take(pa.array(codes))
+        merged[k] = pd.Series(pd.arrays.ArrowExtensionArray(values), index=merged.index).astype(dtype)
+    return merged
+
+
+def _is_sorted_key(s: pd.Series) -> bool:
+    dtype = s.dtype
+    if isinstance(dtype, pd.ArrowDtype):
+        dtype = dtype.numpy_dtype
+    # Only numbers/datetimes: cheap to compare and pandas' sorted join handles them natively
+    if not (pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_datetime64_any_dtype(dtype)):
+        return False
+    if pd.api.types.is_bool_dtype(dtype):
+        return False
+    return s.is_monotonic_increasing and not s.hasnans
+
+
+# pandas validate strings -> (left must be unique, right must be unique)
+_VALIDATE_RULES = {
+    "one_to_one": (True, True), "1:1": (True, True),
+    "one_to_many": (True, False), "1:m": (True, False),
+    "many_to_one": (False, True), "m:1": (False, True),
+    "many_to_many": (False, False), "m:m": (False, False),
+}
+
+
+def _merge_sorted(left: pd.DataFrame,
+                  right: pd.DataFrame,
+                  key: str,
+                  how: JoinHow,
+                  validate: Optional[str],
+                  suffixes: Tuple[str, str],
+                  indicator: bool) -> Optional[pd.DataFrame]:
+    """
+    Merge-join for a single key that is already sorted on both sides: one linear walk over
+    the two keys, no hash table. Produces the same frame as pd.merge.
+    Returns None if validate doesn't pass (or isn't known), so the caller can let pd.merge
+    raise its usual error. Also returns None for frames with duplicate column names.
+    """
+    if not (left.columns.is_unique and right.columns.is_unique):
+        return None
+    l_key = pd.Index(left[key])
+    r_key = pd.Index(right[key])
+    if validate:
+        need_l, need_r = _VALIDATE_RULES.get(validate, (None, None))
+        if need_l is None or (need_l and not l_key.is_unique) or (need_r and not r_key.is_unique):
+            return None
+
+    join_index, l_idx, r_idx = l_key.join(r_key, how=how, return_indexers=True)
+    n = len(join_index)
+    index = pd.RangeIndex(n)
+
+    def _take(s: pd.Series, idx) -> pd.Series:
+        if idx is None:  # this side is already in output order
+            values = s.array
+        else:
+            values = s.array if isinstance(s.dtype, pd.api.extensions.ExtensionDtype) else s.to_numpy()
+            values = pd.api.extensions.take(values, idx, allow_fill=True)
+        # Explicit dtype: otherwise pandas re-infers object columns of text as "str"
+        return pd.Series(values, dtype=values.dtype, index=index, copy=False)
+
+    l_suf, r_suf = suffixes
+    overlap = (set(left.columns) & set(right.columns)) - {key}
+    out = {}
+    for c in left.columns:
+        if c == key:
+            out[c] = pd.Series(join_index.array, dtype=join_index.dtype, index=index, copy=False)
+        else:
+            out[c + l_suf if c in overlap else c] = _take(left[c], l_idx)
+    for c in right.columns:
+        if c != key:
+            out[c + r_suf if c in overlap else c] = _take(right[c], r_idx)
+    if indicator:
+        in_left = np.ones(n, dtype=bool) if l_idx is None else l_idx != -1
+        in_right = np.ones(n, dtype=bool) if r_idx is None else r_idx != -1
+        codes = np.where(in_left & in_right, 2, np.where(in_left, 0, 1)).astype(np.int8)
+        out["_merge"] = pd.Series(pd.Categorical.from_codes(codes, categories=MERGE_CATEGORIES), index=index)
+    return pd.DataFrame(out, index=index, copy=False)
+
+
+def _rechunk_arrow_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Combine Arrow-backed columns that ended up split into very many small chunks (merges keep
+    the input chunking), which otherwise makes later string/compute ops dramatically slower.
+    Only those columns are rewritten; everything else is left as is.
+    """
+    max_chunks = max(8, len(df) // 100_000)
+    for i in range(df.shape[1]):  # by position, so duplicate column names are fine
+        col = df.iloc[:, i]
+        if not _is_arrow_backed(col.dtype):
+            continue
+        chunked = _arrow_chunks(col)
+        if chunked.num_chunks > max_chunks:
+            df.isetitem(i, pd.Series(_wrap_arrow(chunked.combine_chunks(), col.dtype), index=df.index))
+    return df
+
+
+def _promote_numeric_keys(left: pd.DataFrame, right: pd.DataFrame, on: List[str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Cast Arrow numeric keys of different types (int64 on one side, double on the other) to
+    a common type on both sides. pandas would cast the right keys to the left type and fail
+    on values like 3.5.
+    """
+    for k in on:
+        lt, rt = left[k].dtype, right[k].dtype
+        if not (isinstance(lt, pd.ArrowDtype) and isinstance(rt, pd.ArrowDtype)) or lt == rt:
+            continue
+        common = _common_arrow_type(lt.pyarrow_dtype, rt.pyarrow_dtype)
+        if common is None or pa.types.is_string(common) or pa.types.is_large_string(common):
+            continue
+        dtype = pd.ArrowDtype(common)
+        if lt != dtype:
+            left = left.copy(deep=False)
+            left[k] = left[k].astype(dtype)
+        if rt != dtype:
+            right = right.copy(deep=False)
+            right[k] = right[k].astype(dtype)
+    return left, right
+
+
 def merge_frames(left: pd.DataFrame,
                  right: pd.DataFrame,
                  on: List[str],
                  how: JoinHow = "inner",
                  validate: Optional[str] = None,
                  suffixes: Tuple[str, str] = ("_left", "_right"),
-                 indicator: bool = True) -> pd.DataFrame:
+                 indicator: bool = False) -> pd.DataFrame:
     """
     Merge with pandas.merge and (optionally) get a _merge indicator column.
     - on: join keys. They must exist in both frames.
     - how: inner/left/right/outer
     - validate: pandas join validation string, e.g., "one_to_one", "one_to_many", etc.
     - suffixes: appended to overlapping column names from left/right
+    - indicator: add the _merge column needed by audit_counts. Off by default so plain
+      merges don't pay for it; quick_merge_with_audit turns it on.
     """
     missing_left = [k for k in on if k not in left.columns]
     missing_right = [k for k in on if k not in right.columns]
     if missing_left or missing_right:
         raise KeyError(f"Join keys missing — left:{missing_left} right:{missing_right}")
+    left, right = _promote_numeric_keys(left, right, on)
+
+    # Keys already sorted on both sides (e.g. a DB extract): walk them once instead of hashing.
+    # Inner joins are left to pandas, which is already as fast there.
+    if (how != "inner" and len(on) == 1 and left[on[0]].dtype == right[on[0]].dtype
+            and _is_sorted_key(left[on[0]]) and _is_sorted_key(right[on[0]])):
+        merged = _merge_sorted(left, right, on[0], how, validate, suffixes, indicator)
+        if merged is not None:
+            return _rechunk_arrow_columns(merged)
+
+    # String keys are joined on shared dictionary codes, then decoded back afterwards
+    if _join_on_key_values(left, right, on, how, validate):
+        encoded_left, encoded_right, dictionaries = _plain_keys(left, on), _plain_keys(right, on), {}
+    else:
+        encoded_left, encoded_right, dictionaries = _encode_string_keys(left, right, on, sort=(how == "outer"))
 
     merged = pd.merge(
-        left, right,
+        encoded_left, encoded_right,
         how=how,
         on=on,
         suffixes=suffixes,
         validate=validate,
         indicator=indicator
     )
-    return merged
+    for k in on:
+        if _is_arrow_dictionary(left[k]) and k not in dictionaries:
+            merged[k] = merged[k].astype(left[k].dtype)  # _plain_keys took the dictionary off
+    return _rechunk_arrow_columns(_decode_keys(merged, dictionaries))
+
+
+def _common_arrow_type(a: pa.DataType, b: pa.DataType) -> Optional[pa.DataType]:
+    """
+    Type both Arrow types can be cast to without losing values (int64 + double -> double),
+    or None if there isn't an obvious one.
+    """
+    def numeric(t: pa.DataType) -> bool:
+        return pa.types.is_integer(t) or pa.types.is_floating(t)
+    if numeric(a) and numeric(b):
+        return pa.from_numpy_dtype(np.promote_types(a.to_pandas_dtype(), b.to_pandas_dtype()))
+    text = (pa.types.is_string(a) or pa.types.is_large_string(a),
+            pa.types.is_string(b) or pa.types.is_large_string(b))
+    if all(text):
+        return pa.large_string() if pa.types.is_large_string(a) or pa.types.is_large_string(b) else pa.string()
+    return None
+
+
+def _coalesce(left: pd.Series, right: pd.Series) -> pd.Series:
+    """
+    Take left where it isn't null, else right, in a single pass over both columns.
+    """
+    if left.dtype == right.dtype:
+        if _is_arrow_backed(left.dtype):
+            values = pc.coalesce(_arrow_chunks(left), _arrow_chunks(right))
+            return pd.Series(_wrap_arrow(values, left.dtype), index=left.index, name=left.name)
+    elif _is_arrow_backed(left.dtype) and _is_arrow_backed(right.dtype):
+        l_arr, r_arr = _arrow_chunks(left), _arrow_chunks(right)
+        # An all-empty CSV column is read as Arrow's null type: just take the other side
+        if pa.types.is_null(l_arr.type):
+            return pd.Series(right.array, index=left.index, name=left.name)
+        if pa.types.is_null(r_arr.type):
+            return left
+        common = _common_arrow_type(l_arr.type, r_arr.type)
+        if common is not None:
+            values = pc.coalesce(l_arr.cast(common), r_arr.cast(common))
+            dtype = left.dtype if l_arr.type == common else right.dtype if r_arr.type == common \
+                else pd.ArrowDtype(common)
+            return pd.Series(_wrap_arrow(values, dtype), index=left.index, name=left.name)
+        if isinstance(left.dtype, np.dtype):
+            l_vals = left.to_numpy(copy=False)
+            r_vals = right.to_numpy(copy=False)
+            return pd.Series(np.where(pd.isna(l_vals), r_vals, l_vals),
+                             index=left.index, name=left.name, dtype=left.dtype)
+    # Mixed or extension dtypes: let pandas work out the result dtype
+    return left.where(left.notna(), right)
 
 
 def resolve_conflicts(df: pd.DataFrame,
@@ -131,6 +902,7 @@ def resolve_conflicts(df: pd.DataFrame,
     Leaves original suffixed columns in place for audit unless you drop them later.
     """
     l_suf, r_suf = suffixes
+    new_cols: Dict[str, pd.Series] = {}
     for base, strategy in base_to_strategy.items():
         left_col = base + l_suf
         right_col = base + r_suf
@@ -140,14 +912,15 @@ def resolve_conflicts(df: pd.DataFrame,
 
         out_col = base  # final, de-suffixed column
         if strategy == "left":
-            df[out_col] = df[left_col]
+            new_cols[out_col] = df[left_col]
         elif strategy == "right":
-            df[out_col] = df[right_col]
+            new_cols[out_col] = df[right_col]
         elif strategy == "coalesce":
-            df[out_col] = df[left_col].where(df[left_col].notna(), df[right_col])
+            new_cols[out_col] = _coalesce(df[left_col], df[right_col])
         else:
             raise ValueError(f"Unknown strategy '{strategy}' for column '{base}'. Use left/right/coalesce.")
-    return df
+    # Add all resolved columns in one go instead of growing the frame once per column
+    return df.assign(**new_cols) if new_cols else df
 
 
 def audit_counts(merged_with_indicator: pd.DataFrame) -> Dict[str, int]:
@@ -157,15 +930,42 @@ def audit_counts(merged_with_indicator: pd.DataFrame) -> Dict[str, int]:
     """
     if "_merge" not in merged_with_indicator.columns:
         raise KeyError("No _merge column found. Call merge_frames(..., indicator=True).")
-    value_counts = merged_with_indicator["_merge"].value_counts(dropna=False)
+    merge_col = merged_with_indicator["_merge"]
+    if not isinstance(merge_col.dtype, pd.CategoricalDtype):
+        merge_col = merge_col.astype(pd.CategoricalDtype(MERGE_CATEGORIES))
+    # One counting pass over the int8 category codes (-1 = missing, not counted)
+    codes = merge_col.cat.codes.to_numpy()
+    cats = merge_col.cat.categories
+    counts_arr = np.bincount(codes[codes >= 0], minlength=len(cats))
+    by_cat = {c: int(counts_arr[i]) for i, c in enumerate(cats)}
     return {
-        "left_only": int(value_counts.get("left_only", 0)),
-        "right_only": int(value_counts.get("right_only", 0)),
-        "both": int(value_counts.get("both", 0)),
+        "left_only": by_cat.get("left_only", 0),
+        "right_only": by_cat.get("right_only", 0),
+        "both": by_cat.get("both", 0),
         "total_rows": int(len(merged_with_indicator)),
     }
 
 
+def _render_table(df: pd.DataFrame, na_rep: str = "<NA>") -> str:
+    """
+    Plain-text table of a (small) frame: each column is converted to strings with one Arrow
+    cast and its width computed once, then rows are assembled. Columns Arrow can't hold or
+    cast (mixed types, lists, dicts, ...) fall back to str() per value.
+    """
+    columns = []
+    for name, s in df.items():  # by position, so duplicate column names are fine
+        try:
+            col = _arrow_chunks(s)
+            if pa.types.is_dictionary(col.type):
+                col = pc.cast(col, col.type.value_type)
+            cells = pc.fill_null(pc.cast(col, pa.string()), na_rep).to_pylist()
+        except pa.ArrowException:
+            cells = [na_rep if pd.api.types.is_scalar(v) and pd.isna(v) else str(v) for v in s.tolist()]
+        width = max([len(str(name))] + [len(c) for c in cells])
+        columns.append([str(name).rjust(width)] + [c.rjust(width) for c in cells])
+    return "\n".join(" ".join(row) for row in zip(*columns))
+
+
 def save_report(path: str,
                 counts: Dict[str, int],
                 sample_left_only: Optional[pd.DataFrame] = None,
@@ -174,26 +974,225 @@ def save_report(path: str,
     """
     Write a plain-text audit report for your merge.
     """
-    lines = []
-    lines.append("=== Merge Audit Report ===")
-    lines.append(f"Total rows in merged output: {counts.get('total_rows', 0)}")
-    lines.append(f"Matched on both sides      : {counts.get('both', 0)}")
-    lines.append(f"Left-only rows             : {counts.get('left_only', 0)}")
-    lines.append(f"Right-only rows            : {counts.get('right_only', 0)}")
-    lines.append("")
+    buf = io.StringIO()
+    buf.write("=== Merge Audit Report ===\n")
+    buf.write(f"Total rows in merged output: {counts.get('total_rows', 0)}\n")
+    buf.write(f"Matched on both sides      : {counts.get('both', 0)}\n")
+    buf.write(f"Left-only rows             : {counts.get('left_only', 0)}\n")
+    buf.write(f"Right-only rows            : {counts.get('right_only', 0)}\n")
+    buf.write("\n")
 
-    def _df_to_text(df: Optional[pd.DataFrame], title: str) -> List[str]:
+    def _df_to_text(df: Optional[pd.DataFrame], title: str) -> str:
         if df is None or df.empty:
-            return [f"{title}: (none)"]
-        head = df.head(sample_size)
-        return [title + " (showing up to " + str(sample_size) + "):", head.to_string(index=False)]
+            return f"{title}: (none)"
+        return f"{title} (showing up to {sample_size}):\n" + _render_table(df.head(sample_size))
 
-    lines += _df_to_text(sample_left_only, "Examples of LEFT-ONLY rows")
-    lines.append("")
-    lines += _df_to_text(sample_right_only, "Examples of RIGHT-ONLY rows")
+    buf.write(_df_to_text(sample_left_only, "Examples of LEFT-ONLY rows"))
+    buf.write("\n\n")
+    buf.write(_df_to_text(sample_right_only, "Examples of RIGHT-ONLY rows"))
 
     with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        f.write(buf.getvalue())
+
+
+def _import_polars():
+    try:
+        import polars as pl
+    except ImportError as e:
+        raise ImportError("backend='polars' requires the polars package (pip install polars)") from e
+    return pl
+
+
+def _to_polars(pl, dtype):
+    """
+    Translate a pandas dtype to a Polars dtype (via Arrow), or None if we don't know it.
+    """
+    arrow_type = _to_arrow(dtype)
+    if arrow_type is None:
+        return None
+    return pl.from_arrow(pa.array([], type=arrow_type)).dtype
+
+
+# pandas validate strings -> Polars join validation
+_POLARS_VALIDATE = {
+    "one_to_one": "1:1", "1:1": "1:1",
+    "one_to_many": "1:m", "1:m": "1:m",
+    "many_to_one": "m:1", "m:1": "m:1",
+    "many_to_many": "m:m", "m:m": "m:m",
+}
+
+
+def _scan_csv_polars(pl,
+                     path: str,
+                     dtype_map: Optional[Dict[str, str]] = None,
+                     parse_dates: Optional[Iterable[str]] = None,
+                     dedupe_keys: Optional[List[str]] = None,
+                     include_columns: Optional[List[str]] = None,
+                     filters: Optional[Dict[str, Iterable]] = None):
+    """
+    Lazy equivalent of read_csv + drop_dupes_on. Nothing is read until the plan is collected,
+    and the column selection/filters are pushed down into the CSV scan by the optimizer.
+    Bad values in dtype_map/parse_dates columns become null instead of raising.
+    """
+    names = _final_column_names(path, _read_header(path))
+    date_cols = [c for c in (parse_dates or []) if c in names]
+    lf = pl.scan_csv(path,
+                     new_columns=names,
+                     schema_overrides={c: pl.String for c in date_cols},
+                     try_parse_dates=True)
+    if include_columns is not None:
+        missing = [c for c in include_columns if c not in names]
+        if missing:
+            raise KeyError(f"Columns not found in {path}: {missing}")
+        names = [c for c in names if c in set(include_columns)]
+        date_cols = [c for c in date_cols if c in names]
+        lf = lf.select(names)
+
+    casts = []
+    unsupported = {}
+    for col, dtype in (dtype_map or {}).items():
+        if col not in names:
+            continue
+        pl_type = _to_polars(pl, dtype)
+        if pl_type is None:
+            unsupported[col] = dtype
+            continue
+        casts.append(pl.col(col).cast(pl_type, strict=False))
+    if unsupported:
+        logger.warning("dtypes not supported by the polars backend, columns kept as-is: %s", unsupported)
+    casts += [pl.col(c).str.to_datetime(strict=False, time_unit="ns") for c in date_cols]
+    if casts:
+        lf = lf.with_columns(casts)
+
+    if filters:
+        missing = [c for c in filters if c not in names]
+        if missing:
+            raise KeyError(f"Filter column not found: {missing[0]}")
+        # Same matching rules as the pandas path: values cast to the column type, None matches null
+        schema = lf.collect_schema()
+        conditions = []
+        for c, values in filters.items():
+            target = pl.Series([], dtype=schema[c]).to_arrow().type
+            value_set = pl.from_arrow(_filter_values(c, values, target))
+            conditions.append(pl.col(c).is_in(value_set.implode(), nulls_equal=True))
+        lf = lf.filter(conditions)
+
+    if dedupe_keys:
+        missing = [k for k in dedupe_keys if k not in names]
+        if missing:
+            raise KeyError(f"Keys not found in dataframe: {missing}")
+        lf = lf.unique(subset=dedupe_keys, keep="last", maintain_order=True)
+    return lf, names
+
+
+def _quick_merge_polars(left_path: str,
+                        right_path: str,
+                        on: List[str],
+                        how: JoinHow,
+                        left_dtypes: Optional[Dict[str, str]],
+                        right_dtypes: Optional[Dict[str, str]],
+                        left_parse_dates: Optional[Iterable[str]],
+                        right_parse_dates: Optional[Iterable[str]],
+                        dedupe_left_keys: Optional[List[str]],
+                        dedupe_right_keys: Optional[List[str]],
+                        validate: Optional[str],
+                        suffixes: Tuple[str, str],
+                        conflicts: Optional[Dict[str, Literal["left", "right", "coalesce"]]],
+                        left_include: Optional[List[str]] = None,
+                        right_include: Optional[List[str]] = None,
+                        left_filter: Optional[Dict[str, Iterable]] = None,
+                        right_filter: Optional[Dict[str, Iterable]] = None) -> pd.DataFrame:
+    """
+    Read, cast, de-duplicate, join and resolve conflicts for both CSVs as one Polars lazy
+    plan, collected once with the streaming engine. Returns the same frame the pandas path
+    (merge_frames(..., indicator=True) + resolve_conflicts) would.
+    """
+    pl = _import_polars()
+    lf_l, left_cols = _scan_csv_polars(pl, left_path, left_dtypes, left_parse_dates, dedupe_left_keys,
+                                       include_columns=left_include, filters=left_filter)
+    lf_r, right_cols = _scan_csv_polars(pl, right_path, right_dtypes, right_parse_dates, dedupe_right_keys,
+                                        include_columns=right_include, filters=right_filter)
+
+    missing_left = [k for k in on if k not in left_cols]
+    missing_right = [k for k in on if k not in right_cols]
+    if missing_left or missing_right:
+        raise KeyError(f"Join keys missing — left:{missing_left} right:{missing_right}")
+
+    # Polars only suffixes the right side, so apply pandas-style suffixes to both ourselves
+    l_suf, r_suf = suffixes
+    overlap = (set(left_cols) & set(right_cols)) - set(on)
+    left_out = [c + l_suf if c in overlap else c for c in left_cols]
+    right_out = [c + r_suf if c in overlap else c for c in right_cols if c not in on]
+    lf_l = lf_l.rename({c: c + l_suf for c in overlap}).with_columns(pl.lit(True).alias("_in_left"))
+    lf_r = lf_r.rename({c: c + r_suf for c in overlap}).with_columns(pl.lit(True).alias("_in_right"))
+
+    # Keep pandas' row order: left/right keep their side's order, inner follows the left
+    # side and outer is sorted by key.
+    maintain_order = {"inner": "left", "left": "left", "right": "right", "outer": "left_right"}[how]
+    joined = lf_l.join(lf_r,
+                       on=on,
+                       how="full" if how == "outer" else how,
+                       validate=_POLARS_VALIDATE[validate] if validate else "m:m",
+                       nulls_equal=True,
+                       coalesce=True,
+                       maintain_order=maintain_order)
+    if how == "outer":
+        joined = joined.sort(on, nulls_last=True, maintain_order=True)
+
+    in_left = pl.col("_in_left").fill_null(False)
+    in_right = pl.col("_in_right").fill_null(False)
+    merge_flag = (pl.when(in_left & in_right).then(pl.lit("both"))
+                  .when(in_left).then(pl.lit("left_only"))
+                  .otherwise(pl.lit("right_only"))
+                  .alias("_merge"))
+
+    # Same rules as resolve_conflicts, but as expressions inside the plan
+    out_names = left_out + right_out
+    resolved = {}
+    for base, strategy in (conflicts or {}).items():
+        left_col, right_col = base + l_suf, base + r_suf
+        if left_col not in out_names or right_col not in out_names:
+            continue
+        if strategy == "left":
+            expr = pl.col(left_col)
+        elif strategy == "right":
+            expr = pl.col(right_col)
+        elif strategy == "coalesce":
+            expr = pl.coalesce(left_col, right_col)
+        else:
+            raise ValueError(f"Unknown strategy '{strategy}' for column '{base}'. Use left/right/coalesce.")
+        resolved[base] = expr.alias(base)
+    # Resolved columns replace same-named columns in place; new ones go after _merge
+    columns = [resolved.pop(c) if c in resolved else pl.col(c) for c in out_names]
+    joined = joined.select(columns + [merge_flag] + list(resolved.values()))
+
+    try:
+        collected = joined.collect(engine="streaming")
+    except pl.exceptions.ComputeError as e:
+        if validate and "validation" in str(e):
+            # Same exception type as pd.merge, so callers' except MergeError keeps working
+            raise pd.errors.MergeError(f"Merge keys are not unique; not a {validate} merge ({e})") from e
+        raise
+    table = collected.to_arrow()
+    # Polars hands out large_string text and uint32-indexed categoricals; match read_csv's types
+    for i, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(_ARROW_TYPES["category"]))
+    merged = table.to_pandas(types_mapper=_pandas_types_mapper(), self_destruct=True, split_blocks=True)
+    merged["_merge"] = merged["_merge"].astype(pd.CategoricalDtype(MERGE_CATEGORIES))
+    return merged
+
+
+def _columns_to_read(cols: Optional[List[str]],
+                     on: List[str],
+                     dedupe_keys: Optional[List[str]],
+                     filters: Optional[Dict[str, Iterable]]) -> Optional[List[str]]:
+    """
+    Requested columns plus the ones the merge itself needs, or None for "all columns".
+    """
+    if cols is None:
+        return None
+    return list(dict.fromkeys([*cols, *on, *(dedupe_keys or []), *(filters or {})]))
 
 
 def quick_merge_with_audit(
@@ -210,6 +1209,12 @@ def quick_merge_with_audit(
     validate: Optional[str] = None,
     suffixes: Tuple[str, str] = ("_left", "_right"),
     conflicts: Optional[Dict[str, Literal["left", "right", "coalesce"]]] = None,
+    backend: Backend = "pandas",
+    batch_rows: Optional[int] = None,
+    left_cols: Optional[List[str]] = None,
+    right_cols: Optional[List[str]] = None,
+    left_filter: Optional[Dict[str, Iterable]] = None,
+    right_filter: Optional[Dict[str, Iterable]] = None,
 ) -> Tuple[pd.DataFrame, Dict[str, int]]:
     """
     One-call helper for the common case:
@@ -219,19 +1224,64 @@ def quick_merge_with_audit(
       - merges with indicator
       - optional conflict resolution
       - returns merged df + counts
+
+    backend="polars" runs read/cast/de-dupe/merge/conflict resolution as a single lazy
+    Polars plan (multi-core, streaming) and only converts to pandas at the end.
+    batch_rows (pandas backend) streams each CSV in batches and de-duplicates batch by
+    batch, so inputs with many duplicate keys never have to fit in memory whole.
+    left_cols/right_cols limit which columns are parsed at all (join, de-dupe and filter
+    keys are always included); left_filter/right_filter, e.g. {"city": ["Columbus"]}, drop
+    rows before de-duplication and the merge.
     """
-    left = read_csv(left_path, dtype_map=left_dtypes, parse_dates=left_parse_dates)
-    right = read_csv(right_path, dtype_map=right_dtypes, parse_dates=right_parse_dates)
+    left_include = _columns_to_read(left_cols, on, dedupe_left_keys, left_filter)
+    right_include = _columns_to_read(right_cols, on, dedupe_right_keys, right_filter)
 
-    if dedupe_left_keys:
-        left = drop_dupes_on(left, dedupe_left_keys, keep="last")
-    if dedupe_right_keys:
-        right = drop_dupes_on(right, dedupe_right_keys, keep="last")
+    if backend == "polars":
+        merged = _quick_merge_polars(left_path, right_path, on, how,
+                                     left_dtypes, right_dtypes,
+                                     left_parse_dates, right_parse_dates,
+                                     dedupe_left_keys, dedupe_right_keys,
+                                     validate, suffixes, conflicts,
+                                     left_include, right_include,
+                                     left_filter, right_filter)
+    elif backend == "pandas":
+        # The two reads are independent and Arrow's parser releases the GIL, so run them
+        # side by side.
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            if batch_rows:
+                fl = ex.submit(read_csv_batched, left_path, dtype_map=left_dtypes, parse_dates=left_parse_dates,
+                               dedupe_keys=dedupe_left_keys, batch_rows=batch_rows,
+                               include_columns=left_include, filters=left_filter)
+                fr = ex.submit(read_csv_batched, right_path, dtype_map=right_dtypes, parse_dates=right_parse_dates,
+                               dedupe_keys=dedupe_right_keys, batch_rows=batch_rows,
+                               include_columns=right_include, filters=right_filter)
+            else:
+                fl = ex.submit(read_csv, left_path, dtype_map=left_dtypes, parse_dates=left_parse_dates,
+                               include_columns=left_include, filters=left_filter)
+                fr = ex.submit(read_csv, right_path, dtype_map=right_dtypes, parse_dates=right_parse_dates,
+                               include_columns=right_include, filters=right_filter)
+            left, right = fl.result(), fr.result()
 
-    merged = merge_frames(left, right, on=on, how=how, validate=validate, suffixes=suffixes, indicator=True)
+        if batch_rows:
+            left = left.to_pandas(types_mapper=_pandas_types_mapper(), self_destruct=True, split_blocks=True)
+            right = right.to_pandas(types_mapper=_pandas_types_mapper(), self_destruct=True, split_blocks=True)
+            # dtypes Arrow can't express (read_csv_batched leaves them out), same as read_csv
+            for df, dtypes, path in ((left, left_dtypes, left_path), (right, right_dtypes, right_path)):
+                casts = {c: d for c, d in (dtypes or {}).items() if c in df.columns and _to_arrow(d) is None}
+                failures = _cast_columns(df, casts)
+                if failures:
+                    logger.warning("Could not convert columns in %s (kept as-is): %s", path, failures)
+        else:
+            if dedupe_left_keys:
+                left = drop_dupes_on(left, dedupe_left_keys, keep="last")
+            if dedupe_right_keys:
+                right = drop_dupes_on(right, dedupe_right_keys, keep="last")
 
-    if conflicts:
-        merged = resolve_conflicts(merged, conflicts, suffixes=suffixes)
+        merged = merge_frames(left, right, on=on, how=how, validate=validate, suffixes=suffixes, indicator=True)
+        if conflicts:
+            merged = resolve_conflicts(merged, conflicts, suffixes=suffixes)
+    else:
+        raise ValueError(f"Unknown backend '{backend}'. Use pandas/polars.")
 
     counts = audit_counts(merged)
     return merged, counts
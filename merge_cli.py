@@ -9,28 +9,91 @@ The example above will:
 - De-duplicate both sides on customer_id, keeping the last occurrence
 - Coalesce overlapping 'city' and 'email' columns (taking left where available)
 - Save merged.csv and a merge audit report
+
+Use --output merged.parquet (or --output-format parquet) for Snappy-compressed Parquet output.
 """
 
 import argparse
+import csv
+import io
+import logging
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from datamerge import quick_merge_with_audit, audit_counts, resolve_conflicts
 
+def _needs_quotes(tbl: pa.Table) -> bool:
+    """
+    True if any text value holds a comma, quote or line break, i.e. can't be written unquoted.
+    """
+    for col in tbl.columns:
+        for chunk in col.chunks:
+            values = chunk.dictionary if pa.types.is_dictionary(chunk.type) else chunk
+            if not (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+                break
+            if pc.any(pc.match_substring_regex(values, r'[,"\r\n]')).as_py():
+                return True
+    return False
+
+def write_merged(merged: pd.DataFrame, out_path: Path, output_format: Optional[str] = None) -> None:
+    """
+    Write the merged frame through Arrow: Parquet (Snappy) or CSV.
+    output_format defaults to parquet for .parquet/.pq paths, csv otherwise.
+    """
+    if output_format is None:
+        output_format = "parquet" if out_path.suffix.lower() in (".parquet", ".pq") else "csv"
+    tbl = pa.Table.from_pandas(merged, preserve_index=False)
+    if output_format == "parquet":
+        pq.write_table(tbl, out_path, compression="snappy", use_dictionary=True,
+                       data_page_size=1 << 20, write_statistics=True)
+    else:
+        # Arrow quotes every header name, so write the header like pandas would
+        header = io.StringIO()
+        csv.writer(header, lineterminator="\n").writerow(tbl.column_names)
+        # Arrow's "needed" style still quotes every string; skip quotes unless a value needs them
+        quoting = "needed" if _needs_quotes(tbl) else "none"
+        with open(out_path, "wb") as f:
+            f.write(header.getvalue().encode("utf-8"))
+            pacsv.write_csv(tbl, f, write_options=pacsv.WriteOptions(include_header=False, batch_size=64 << 10,
+                                                                     quoting_style=quoting))
+
+def sample_rows(merged: pd.DataFrame, label: str, n: int) -> pd.DataFrame:
+    """
+    First n rows whose _merge is `label`, found from the categorical codes so only
+    those n rows are copied (not a full boolean-filtered frame).
+    """
+    merge_col = merged["_merge"]
+    if label not in merge_col.cat.categories:
+        return merged.iloc[:0]
+    codes = merge_col.cat.codes.to_numpy()
+    idx = np.flatnonzero(codes == merge_col.cat.categories.get_loc(label))[:n]
+    return merged.iloc[idx]
+
 def main():
     p = argparse.ArgumentParser(description="Merge two CSVs with safe defaults and an audit report.")
     p.add_argument("--left", required=True, help="Path to left CSV")
     p.add_argument("--right", required=True, help="Path to right CSV")
     p.add_argument("--on", required=True, nargs="+", help="Join key(s). Example: --on customer_id OR --on col1 col2")
     p.add_argument("--how", default="left", choices=["inner", "left", "right", "outer"], help="Join type (default: left)")
-    p.add_argument("--output", required=True, help="Where to write merged CSV")
+    p.add_argument("--output", required=True, help="Where to write merged output (.csv or .parquet)")
+    p.add_argument("--output-format", choices=["csv", "parquet"], help="Output format (default: from --output extension, else csv)")
     p.add_argument("--report", help="Optional path for a text audit report")
     p.add_argument("--dedupe-left", nargs="+", help="Key(s) to de-duplicate left by (keep last)")
     p.add_argument("--dedupe-right", nargs="+", help="Key(s) to de-duplicate right by (keep last)")
     p.add_argument("--validate", help="pandas merge validate string, e.g., one_to_one, one_to_many, many_to_one")
     p.add_argument("--coalesce", nargs="*", default=[], help="Overlapping columns to coalesce (prefer left, fallback to right)")
+    p.add_argument("--backend", default="pandas", choices=["pandas", "polars"], help="Engine to run the merge on (default: pandas)")
+    p.add_argument("--batch-rows", type=int, help="Stream each CSV in batches of about this many rows (pandas backend)")
     args = p.parse_args()
 
+    # Show datamerge's warnings and de-dupe notes on stderr
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
     merged, counts = quick_merge_with_audit(
         left_path=args.left,
         right_path=args.right,
@@ -40,22 +103,25 @@ def main():
         dedupe_right_keys=args.dedupe_right,
         validate=args.validate,
         suffixes=("_left", "_right"),
-        conflicts={c: "coalesce" for c in args.coalesce} if args.coalesce else None
+        conflicts={c: "coalesce" for c in args.coalesce} if args.coalesce else None,
+        backend=args.backend,
+        batch_rows=args.batch_rows,
     )
 
     # Save merged output
     out_path = Path(args.output)
-    merged.to_csv(out_path, index=False)
+    write_merged(merged, out_path, args.output_format)
     print(f"Wrote merged output to {out_path.resolve()}")
 
     # Optional report
     if args.report:
         # Prepare small samples of left-only/right-only
-        left_only = merged[merged["_merge"] == "left_only"]
-        right_only = merged[merged["_merge"] == "right_only"]
+        sample_size = 5
+        left_only = sample_rows(merged, "left_only", sample_size)
+        right_only = sample_rows(merged, "right_only", sample_size)
         # Reuse datamerge.save_report to write a friendly audit
         from datamerge import save_report
-        save_report(args.report, counts, left_only, right_only, sample_size=5)
+        save_report(args.report, counts, left_only, right_only, sample_size=sample_size)
         print(f"Wrote audit report to {Path(args.report).resolve()}")
 
     # Print a tiny summary to stdout too
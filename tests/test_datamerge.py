@@ -0,0 +1,379 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import datamerge as dm
+
+CUSTOMERS = str(Path(__file__).resolve().parent.parent / "customers.csv")
+ORDERS = str(Path(__file__).resolve().parent.parent / "orders.csv")
+
+
+def _write(tmp_path, name, text, bom=False):
+    path = tmp_path / name
+    path.write_bytes((b"\xef\xbb\xbf" if bom else b"") + text.encode("utf-8"))
+    return str(path)
+
+
+@pytest.mark.parametrize("backend, batch_rows", [("pandas", None), ("pandas", 2), ("polars", None)])
+def test_bom_header_is_stripped(tmp_path, backend, batch_rows):
+    if backend == "polars":
+        pytest.importorskip("polars")
+    left = _write(tmp_path, "left.csv", "Customer ID,City\n1,Columbus\n2,Richmond\n", bom=True)
+    right = _write(tmp_path, "right.csv", "customer_id,amount\n1,10\n3,30\n", bom=True)
+    merged, counts = dm.quick_merge_with_audit(left, right, on=["customer_id"], how="outer",
+                                               backend=backend, batch_rows=batch_rows)
+    assert merged.columns[0] == "customer_id"
+    assert counts == {"left_only": 1, "right_only": 1, "both": 1, "total_rows": 3}
+
+
+def test_duplicate_header_names_are_mangled_like_pandas(tmp_path):
+    path = _write(tmp_path, "dupes.csv", "a,a,b,a.1\n1,2,3,4\n")
+    df = dm.read_csv(path)
+    expected = pd.read_csv(path)
+    assert list(df.columns) == list(expected.columns) == ["a", "a.2", "b", "a.1"]
+    assert df.iloc[0].tolist() == expected.iloc[0].tolist()
+    assert dm.read_csv_batched(path, include_columns=["a.2"]).column("a.2").to_pylist() == [2]
+
+
+def test_columns_colliding_after_normalization_raise(tmp_path):
+    path = _write(tmp_path, "collide.csv", "City,city \nColumbus,Richmond\n")
+    with pytest.raises(ValueError, match="Duplicate column names"):
+        dm.read_csv(path)
+
+
+def test_batched_read_survives_type_change_after_first_block(tmp_path):
+    # ~15 bytes a row, so the 64 KB minimum block holds a few thousand rows
+    rows = [f"{i},{i if i < 15000 else f'X{i}'},{i % 7}" for i in range(20000)]
+    path = _write(tmp_path, "drift.csv", "id,code,n\n" + "\n".join(rows) + "\n")
+    table = dm.read_csv_batched(path, dtype_map={"id": "Int64"}, batch_rows=1000)
+    full = dm.read_csv(path, dtype_map={"id": "Int64"})
+    assert table.num_rows == len(full) == 20000
+    assert table.schema.field("code").type == "string"
+    assert table.schema.field("n").type == "int64"
+    assert table.column("code").to_pylist() == full["code"].tolist()
+
+    merged, counts = dm.quick_merge_with_audit(path, path, on=["id"], batch_rows=1000)
+    assert counts["both"] == 20000
+
+
+@pytest.mark.parametrize("dtype", [object, "string[pyarrow]", "str", "category",
+                                   pd.ArrowDtype(pa.dictionary(pa.int32(), pa.string()))])
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_merge_empty_frames_with_string_keys(dtype, how):
+    left = pd.DataFrame({"k": pd.Series([], dtype=dtype), "a": pd.Series([], dtype="int64")})
+    right = pd.DataFrame({"k": pd.Series([], dtype=dtype), "b": pd.Series([], dtype="int64")})
+    merged = dm.merge_frames(left, right, on=["k"], how=how)
+    expected = pd.merge(left, right, on=["k"], how=how, suffixes=("_left", "_right"))
+    pd.testing.assert_frame_equal(merged, expected)
+
+
+def test_save_report_renders_frames_arrow_cannot_hold(tmp_path):
+    sample = pd.DataFrame([[1, [1, 2], {"a": 1}, 1.5], ["x", [3], {"a": 2}, None], [None, [], {}, 2.0]],
+                          columns=["mixed", "lists", "dicts", "mixed"])
+    path = tmp_path / "report.txt"
+    dm.save_report(str(path), {"total_rows": 3}, sample_left_only=sample)
+    lines = path.read_text().splitlines()
+    header = lines.index("Examples of LEFT-ONLY rows (showing up to 5):") + 1
+    assert lines[header].split() == ["mixed", "lists", "dicts", "mixed"]
+    assert "x" in lines[header + 2] and "<NA>" in lines[header + 3]
+
+
+@pytest.mark.parametrize("left_filter, expected_rows", [
+    ({"customer_id": ["1001"]}, 1),
+    ({"signup_date": ["2024-02-01"]}, 1),
+    ({"city": ["Columbus", None]}, 3),
+])
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_filters_match_the_same_rows_on_both_backends(tmp_path, backend, left_filter, expected_rows):
+    if backend == "polars":
+        pytest.importorskip("polars")
+    left = _write(tmp_path, "left.csv", "customer_id,signup_date,city\n"
+                                        "1001,2024-02-01,Richmond\n1002,2024-03-15,Columbus\n"
+                                        "1003,2024-04-01,\n1004,2024-05-01,\n")
+    right = _write(tmp_path, "right.csv", "customer_id,amount\n1001,10\n")
+    merged, counts = dm.quick_merge_with_audit(left, right, on=["customer_id"], backend=backend,
+                                               left_parse_dates=["signup_date"], left_filter=left_filter)
+    assert counts["total_rows"] == expected_rows
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_filter_values_that_do_not_fit_raise(tmp_path, backend):
+    if backend == "polars":
+        pytest.importorskip("polars")
+    path = _write(tmp_path, "left.csv", "customer_id,city\n1001,Richmond\n")
+    with pytest.raises(ValueError, match="customer_id"):
+        dm.quick_merge_with_audit(path, path, on=["customer_id"], backend=backend,
+                                  left_filter={"customer_id": ["abc"]})
+
+
+@pytest.mark.parametrize("how", ["left", "right", "outer"])
+def test_sorted_merge_keeps_object_columns_and_pandas_errors(how):
+    left = pd.DataFrame({"k": [1, 2, 2, 3], "name": pd.Series(list("abcd"), dtype=object)})
+    right = pd.DataFrame({"k": [2, 3, 4], "city": pd.Series(["x", None, "z"], dtype=object)})
+    expected = pd.merge(left, right, on=["k"], how=how, suffixes=("_left", "_right"), indicator=True)
+    merged = dm.merge_frames(left, right, on=["k"], how=how, indicator=True)
+    pd.testing.assert_frame_equal(merged, expected)
+    assert merged["name"].dtype == object
+
+    with pytest.raises(pd.errors.MergeError) as expected_error:
+        pd.merge(left, right, on=["k"], how=how, validate="1:1")
+    with pytest.raises(pd.errors.MergeError) as error:
+        dm.merge_frames(left, right, on=["k"], how=how, validate="1:1")
+    assert str(error.value) == str(expected_error.value)
+
+
+KEY_DTYPES = ["int64", "int64[pyarrow]", "datetime64[ns]", "object", "str", "string[pyarrow]", "category",
+              pd.ArrowDtype(pa.dictionary(pa.int32(), pa.string()))]
+
+
+def _parity_frame(rng, dtype, n, sort, nulls, side):
+    values = rng.integers(0, 6, n)
+    if sort:
+        values = np.sort(values)
+    if dtype == "datetime64[ns]":
+        keys = pd.Series(pd.to_datetime(values, unit="D"))
+    elif dtype in ("int64", "int64[pyarrow]"):
+        keys = pd.Series(values, dtype=dtype)
+        if nulls and dtype == "int64[pyarrow]":
+            keys[rng.random(n) < 0.2] = None
+    else:
+        text = [None if nulls and rng.random() < 0.2 else f"k{v}" for v in values]
+        keys = pd.Series(text, dtype=dtype) if not isinstance(dtype, pd.ArrowDtype) else \
+            pd.Series(text, dtype=pd.ArrowDtype(pa.string())).astype(dtype)
+    return pd.DataFrame({"k": keys,
+                         "name": pd.Series([f"{side}{i}" for i in range(n)], dtype=object),
+                         "n": rng.integers(0, 9, n),
+                         "s": pd.Series([f"s{i}" for i in range(n)], dtype="string[pyarrow]"),
+                         side: rng.random(n)})
+
+
+def _pd_merge(left, right, **kwargs):
+    # pandas can't merge Arrow dictionary keys holding nulls, so compare against their values
+    plain = {}
+    if isinstance(left["k"].dtype, pd.ArrowDtype) and pa.types.is_dictionary(left["k"].dtype.pyarrow_dtype):
+        plain = {"k": pd.ArrowDtype(left["k"].dtype.pyarrow_dtype.value_type)}
+    merged = pd.merge(left.astype(plain), right.astype(plain), on=["k"], suffixes=("_left", "_right"), **kwargs)
+    return merged.astype({"k": left["k"].dtype}) if plain else merged
+
+
+@pytest.mark.parametrize("dtype", KEY_DTYPES, ids=str)
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_merge_frames_matches_pd_merge(dtype, how):
+    rng = np.random.default_rng(0)
+    for validate, indicator in [(None, False), (None, True), ("1:1", True), ("1:m", False), ("m:1", True)]:
+        for sort, nulls in [(False, False), (False, True), (True, False)]:
+            for n_left, n_right in [(0, 0), (0, 3), (5, 4), (8, 8)]:
+                left = _parity_frame(rng, dtype, n_left, sort, nulls, "l")
+                right = _parity_frame(rng, dtype, n_right, sort, nulls, "r")
+                kwargs = dict(how=how, validate=validate, indicator=indicator)
+                try:
+                    expected = _pd_merge(left, right, **kwargs)
+                except pd.errors.MergeError as e:
+                    with pytest.raises(pd.errors.MergeError) as error:
+                        dm.merge_frames(left, right, on=["k"], **kwargs)
+                    assert str(error.value) == str(e)
+                    continue
+                merged = dm.merge_frames(left, right, on=["k"], **kwargs)
+                pd.testing.assert_frame_equal(merged, expected, obj=f"{kwargs} sort={sort} nulls={nulls}")
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_polars_backend_returns_the_pandas_frame(how):
+    pytest.importorskip("polars")
+    kwargs = dict(on=["customer_id"], how=how,
+                  left_dtypes={"city": "category"}, right_dtypes={"city": "category"},
+                  dedupe_left_keys=["customer_id"], conflicts={"city": "coalesce"})
+    expected, expected_counts = dm.quick_merge_with_audit(CUSTOMERS, ORDERS, **kwargs)
+    merged, counts = dm.quick_merge_with_audit(CUSTOMERS, ORDERS, backend="polars", **kwargs)
+    pd.testing.assert_frame_equal(merged, expected)
+    assert counts == expected_counts
+
+
+def test_polars_backend_raises_merge_error_on_failed_validate():
+    pytest.importorskip("polars")
+    with pytest.raises(pd.errors.MergeError):
+        dm.quick_merge_with_audit(CUSTOMERS, ORDERS, on=["customer_id"],
+                                  backend="polars", validate="1:1")
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_merge_dictionary_keys_with_narrow_index_type(how):
+    int8_dict = pd.ArrowDtype(pa.dictionary(pa.int8(), pa.string()))
+    left = pd.DataFrame({"k": pd.Series([f"a{i}" for i in range(100)] + [None], dtype="string[pyarrow]")})
+    right = pd.DataFrame({"k": pd.Series([f"a{i}" for i in range(50, 150)], dtype="string[pyarrow]")})
+    expected = pd.merge(left, right, on=["k"], how=how)
+    merged = dm.merge_frames(left.astype({"k": int8_dict}), right.astype({"k": int8_dict}), on=["k"], how=how)
+    assert merged["k"].astype("string[pyarrow]").tolist() == expected["k"].tolist()
+
+
+@pytest.mark.parametrize("left, right, expected", [
+    (pd.Series([1, None, None], dtype="Int64"), pd.Series([9, 2, None], dtype="Int64"), [1, 2, None]),
+    (pd.Series([1.0, np.nan]), pd.Series([9.0, 2.0]), [1.0, 2.0]),
+    (pd.Series(["a", None], dtype=object), pd.Series(["z", "b"], dtype=object), ["a", "b"]),
+    (pd.Series(["a", None], dtype="string[pyarrow]"), pd.Series(["z", "b"], dtype="string[pyarrow]"), ["a", "b"]),
+    (pd.Series([1, None], dtype="int64[pyarrow]"), pd.Series([9.5, 2.5], dtype="double[pyarrow]"), [1.0, 2.5]),
+    (pd.Series([None, None], dtype=pd.ArrowDtype(pa.null())), pd.Series(["x", None], dtype="string[pyarrow]"),
+     ["x", None]),
+    (pd.Series(["a", None], dtype="string[pyarrow]"), pd.Series([None, None], dtype=pd.ArrowDtype(pa.null())),
+     ["a", None]),
+])
+def test_resolve_conflicts_coalesce(left, right, expected):
+    df = pd.DataFrame({"city_left": left, "city_right": right})
+    out = dm.resolve_conflicts(df, {"city": "coalesce"})
+    assert [None if pd.isna(v) else v for v in out["city"].tolist()] == expected
+    assert list(out.columns) == ["city_left", "city_right", "city"]
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_coalesce_mixed_csv_types(tmp_path, backend):
+    if backend == "polars":
+        pytest.importorskip("polars")
+    left = _write(tmp_path, "l.csv", "id,score,note\n1,1,\n2,,\n")
+    right = _write(tmp_path, "r.csv", "id,score,note\n1,1.5,x\n3,2.5,y\n")
+    merged, _ = dm.quick_merge_with_audit(left, right, on=["id"], how="outer", backend=backend,
+                                          conflicts={"score": "coalesce", "note": "coalesce"})
+    assert merged["score"].dtype == "double[pyarrow]"
+    assert merged["score"].tolist()[::2] == [1.0, 2.5] and pd.isna(merged["score"][1])
+    assert merged["note"].tolist()[::2] == ["x", "y"]
+
+
+def test_rechunk_combines_only_heavily_chunked_arrow_columns():
+    many = pa.chunked_array([pa.array([i], pa.int64()) for i in range(20)])
+    few = pa.chunked_array([pa.array(range(10), pa.int64()), pa.array(range(10, 20), pa.int64())])
+    df = pd.DataFrame({"many": pd.arrays.ArrowExtensionArray(many),
+                       "few": pd.arrays.ArrowExtensionArray(few),
+                       "plain": np.arange(20)})
+    out = dm._rechunk_arrow_columns(df)
+    assert dm._arrow_chunks(out["many"]).num_chunks == 1
+    assert dm._arrow_chunks(out["few"]).num_chunks == 2
+    assert out["many"].tolist() == list(range(20)) and out["plain"].dtype == np.int64
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_merge_frames_with_duplicate_column_names(how):
+    left = pd.DataFrame([[1, "x", "y"], [2, "z", "w"]], columns=["k", "a", "a"]).astype({"k": "int64[pyarrow]"})
+    right = pd.DataFrame({"k": pd.Series([1, 3], dtype="int64[pyarrow]"), "b": [10, 30]})
+    merged = dm.merge_frames(left, right, on=["k"], how=how)
+    pd.testing.assert_frame_equal(merged, pd.merge(left, right, on=["k"], how=how))
+
+
+def test_batched_read_matches_read_csv_dates_and_pandas_dtypes(tmp_path):
+    left = _write(tmp_path, "l.csv", "id,day,n\n1,2024-01-01,5\n2,notadate,6\n3,,7\n")
+    right = _write(tmp_path, "r.csv", "id,x\n1,a\n2,b\n")
+    kwargs = dict(on=["id"], left_parse_dates=["day"], left_dtypes={"n": "UInt8"})
+    batched, _ = dm.quick_merge_with_audit(left, right, batch_rows=1, **kwargs)
+    whole, _ = dm.quick_merge_with_audit(left, right, **kwargs)
+    assert batched["n"].dtype == whole["n"].dtype == "UInt8"
+    assert batched["day"].dtype == whole["day"].dtype == "timestamp[ns][pyarrow]"
+    assert batched["day"].isna().tolist() == whole["day"].isna().tolist() == [False, True, True]
+    assert batched["day"][0] == pd.Timestamp("2024-01-01")
+
+    table = dm.read_csv_batched(left, parse_dates=["day"], filters={"day": ["2024-01-01"]})
+    assert table.column("id").to_pylist() == [1]
+
+
+def test_read_csv_bad_value_only_affects_its_column(tmp_path):
+    path = _write(tmp_path, "x.csv", "id,n,day,z\n1,5,2024-01-02,007\n2,6,notadate,008\n3,oops,2024-01-03,009\n")
+    df = dm.read_csv(path, dtype_map={"id": "Int64", "z": "str"}, parse_dates=["day"])
+    assert df["id"].dtype == "int64[pyarrow]"
+    assert df["day"].dtype == "timestamp[ns][pyarrow]"
+    assert df["day"].isna().tolist() == [False, True, False]
+    assert df["z"].tolist() == ["007", "008", "009"]
+
+    df = dm.read_csv(path, dtype_map={"id": "Int64", "n": "Int64", "z": "str"}, parse_dates=["day"])
+    assert df["id"].dtype == "int64[pyarrow]"
+    assert df["day"].dtype == "timestamp[ns][pyarrow]"
+    assert df["n"].tolist() == ["5", "6", "oops"]
+    assert df["z"].tolist() == ["007", "008", "009"]
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_merge_frames_promotes_int_and_float_keys(how):
+    left = pd.DataFrame({"k": pd.array([1, 2, 3], dtype="int64[pyarrow]"), "a": [1, 2, 3]})
+    right = pd.DataFrame({"k": pd.array([2.0, 3.5, None], dtype="double[pyarrow]"), "b": [1, 2, 3]})
+    merged = dm.merge_frames(left, right, on=["k"], how=how)
+    expected = pd.merge(left.astype({"k": "float64"}), right.astype({"k": "float64"}), on="k", how=how)
+    assert merged["k"].dtype == "double[pyarrow]"
+    assert merged["k"].astype("float64").tolist() == pytest.approx(expected["k"].tolist(), nan_ok=True)
+    assert left["k"].dtype == "int64[pyarrow]"
+
+
+def test_quoted_header_with_newline(tmp_path):
+    path = _write(tmp_path, "x.csv", '"a\nb",c\n1,2\n3,4\n')
+    df = dm.read_csv(path)
+    assert list(df.columns) == ["a\nb", "c"]
+    assert df["c"].tolist() == [2, 4]
+    table = dm.read_csv_batched(path)
+    assert table.column("c").to_pylist() == [2, 4]
+
+
+def test_read_csv_python_string_backend(tmp_path):
+    path = _write(tmp_path, "x.csv", "id,name,city\n1,Ava,Richmond\n2,,Columbus\n3,Noah,\n")
+    arrow = dm.read_csv(path)
+    python = dm.read_csv(path, string_backend="python")
+    assert arrow["name"].dtype == "string[pyarrow]"
+    for col in ("name", "city"):
+        assert python[col].dtype == object
+        assert all(isinstance(v, str) for v in python[col].dropna())
+        assert python[col].isna().tolist() == arrow[col].isna().tolist()
+        assert python[col].dropna().tolist() == arrow[col].dropna().tolist()
+    assert python["id"].dtype == arrow["id"].dtype
+
+    merged = dm.merge_frames(python, python[["id", "city"]], on=["id"], how="left")
+    assert merged["name"].dtype == object
+    assert merged["city_right"].equals(python["city"])
+
+
+@pytest.mark.parametrize("categorical", [True, False])
+def test_audit_counts(categorical):
+    labels = ["both", "left_only", "both", "right_only", "both", None]
+    merge_col = pd.Series(labels, dtype=pd.CategoricalDtype(dm.MERGE_CATEGORIES) if categorical else object)
+    counts = dm.audit_counts(pd.DataFrame({"k": range(len(labels)), "_merge": merge_col}))
+    assert counts == {"left_only": 1, "right_only": 1, "both": 3, "total_rows": 6}
+
+    empty = dm.audit_counts(pd.DataFrame({"_merge": merge_col.iloc[:0]}))
+    assert empty == {"left_only": 0, "right_only": 0, "both": 0, "total_rows": 0}
+
+    with pytest.raises(KeyError):
+        dm.audit_counts(pd.DataFrame({"k": [1]}))
+
+
+def test_audit_counts_matches_value_counts():
+    left = pd.DataFrame({"k": [1, 2, 2, 3], "a": range(4)})
+    right = pd.DataFrame({"k": [2, 3, 4, 4], "b": range(4)})
+    merged = dm.merge_frames(left, right, on=["k"], how="outer", indicator=True)
+    counts = dm.audit_counts(merged)
+    expected = merged["_merge"].value_counts()
+    assert counts == {**{k: int(expected[k]) for k in ("left_only", "right_only", "both")},
+                      "total_rows": len(merged)}
+
+
+@pytest.mark.parametrize("lower", [True, False])
+@pytest.mark.parametrize("strip", [True, False])
+@pytest.mark.parametrize("spaces_to_underscores", [True, False])
+def test_normalize_columns_flags(lower, strip, spaces_to_underscores):
+    columns = [" Customer Id ", "Order  Total", "email", "City\t"]
+    expected = []
+    for name in columns:
+        name = name.strip() if strip else name
+        name = name.lower() if lower else name
+        expected.append(name.replace(" ", "_") if spaces_to_underscores else name)
+    df = pd.DataFrame([range(len(columns))], columns=columns)
+    flags = dict(lower=lower, strip=strip, spaces_to_underscores=spaces_to_underscores)
+    assert list(dm.normalize_columns(df, **flags).columns) == expected
+    assert dm._column_cleaner(lower, strip, spaces_to_underscores) is dm._column_cleaner(lower, strip, spaces_to_underscores)
+
+
+def test_clean_header_is_cached():
+    dm._clean_header.cache_clear()
+    columns = ["A b", "C"]
+    first = dm._clean_column_names(columns)
+    first.append("mutated")  # callers get their own list, not the cached tuple
+    assert dm._clean_column_names(columns) == ["a_b", "c"]
+    info = dm._clean_header.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert dm._clean_column_names(columns, lower=False) == ["A_b", "C"]
+    assert dm._clean_header.cache_info().misses == 2
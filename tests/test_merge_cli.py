@@ -0,0 +1,81 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+import merge_cli
+
+ROOT = Path(__file__).resolve().parent.parent
+CUSTOMERS = ROOT / "customers.csv"
+ORDERS = ROOT / "orders.csv"
+
+
+def _frame():
+    return pd.DataFrame({
+        "id": pd.array([1, 2, 3], dtype="int64[pyarrow]"),
+        "name": pd.array(["Ava Stone", "Cole, Liam", None], dtype="string[pyarrow]"),
+        "note": ['said "hi"', "plain", "x"],
+    })
+
+
+def test_write_merged_csv_matches_pandas_without_quotes(tmp_path):
+    frame = _frame().assign(note=["said hi", "plain", None])
+    frame["name"] = frame["name"].str.replace(",", "")
+    out = tmp_path / "out.csv"
+    merge_cli.write_merged(frame, out)
+    assert out.read_text() == frame.to_csv(index=False)
+
+
+def test_write_merged_csv_quotes_values_that_need_it(tmp_path):
+    out = tmp_path / "out.csv"
+    merge_cli.write_merged(_frame(), out)
+    assert out.read_text().splitlines()[0] == "id,name,note"
+    back = pd.read_csv(out)
+    assert back["id"].tolist() == [1, 2, 3]
+    assert back["name"].tolist()[:2] == ["Ava Stone", "Cole, Liam"]
+    assert back["note"].tolist() == ['said "hi"', "plain", "x"]
+
+
+@pytest.mark.parametrize("name, output_format", [("out.parquet", None), ("out.PQ", None), ("out.dat", "parquet")])
+def test_write_merged_parquet(tmp_path, name, output_format):
+    out = tmp_path / name
+    merge_cli.write_merged(_frame(), out, output_format)
+    back = pq.read_table(out).to_pandas()
+    assert back["id"].tolist() == [1, 2, 3]
+    assert back["name"].tolist()[:2] == ["Ava Stone", "Cole, Liam"]
+    assert back["note"].tolist() == ['said "hi"', "plain", "x"]
+
+
+@pytest.mark.parametrize("output_format", ["csv", "parquet"])
+def test_cli_output_format(tmp_path, monkeypatch, output_format):
+    out = tmp_path / "merged.out"
+    monkeypatch.setattr(sys, "argv", [
+        "merge_cli.py", "--left", str(CUSTOMERS), "--right", str(ORDERS), "--on", "customer_id",
+        "--how", "outer", "--output", str(out), "--output-format", output_format,
+        "--dedupe-left", "customer_id", "--dedupe-right", "customer_id",
+    ])
+    merge_cli.main()
+    back = pd.read_csv(out) if output_format == "csv" else pd.read_parquet(out)
+    assert "_merge" in back.columns
+    assert back["customer_id"].is_unique
+    if output_format == "csv":
+        assert '"' not in out.read_text().splitlines()[0]
+
+
+def test_sample_rows():
+    labels = ["both", "left_only", "right_only", "left_only", "both", "left_only"]
+    merged = pd.DataFrame({"k": range(6),
+                           "_merge": pd.Categorical(labels, categories=["left_only", "right_only", "both"])},
+                          index=[10, 11, 12, 13, 14, 15])
+    picked = merge_cli.sample_rows(merged, "left_only", 2)
+    assert picked.index.tolist() == [11, 13]
+    assert picked.equals(merged[merged["_merge"] == "left_only"].head(2))
+    assert merge_cli.sample_rows(merged, "right_only", 5)["k"].tolist() == [2]
+    assert merge_cli.sample_rows(merged, "left_only", 0).empty
+
+    only_both = merged.assign(_merge=pd.Categorical(["both"] * 6))
+    none = merge_cli.sample_rows(only_both, "left_only", 5)
+    assert none.empty
+    assert list(none.columns) == list(merged.columns)